@@ -10,6 +10,7 @@ class PetExtraPhotoInline(admin.TabularInline):
 @admin.register(Pet)
 class PetAdmin(admin.ModelAdmin):
     list_display = ("nome", "especie", "status", "solicitante", "data_cadastro")
+    list_select_related = ("solicitante",)
     list_filter = ("status", "especie", "data_cadastro")
     search_fields = ("nome", "raca", "solicitante__username")
     prepopulated_fields = {"slug": ("nome",)}
@@ -36,5 +37,6 @@ class PetAdmin(admin.ModelAdmin):
 @admin.register(PetExtraPhoto)
 class PetExtraPhotoAdmin(admin.ModelAdmin):
     list_display = ("pet", "ordem", "data_envio")
+    list_select_related = ("pet",)
     list_filter = ("data_envio", "pet__especie")
     search_fields = ("pet__nome",)
\ No newline at end of file
@@ -1,8 +1,11 @@
 # adocoes/forms.py
+import os
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db.models import Max
 
 from .constants import (
     ALLOWED_IMAGE_EXTENSIONS,
@@ -13,6 +16,12 @@ from .constants import (
 )
 from .models import Pet, PetExtraPhoto
 
+# Pré-calculados uma vez para a validação dos uploads
+_ALLOWED_IMAGE_EXT = frozenset(ext.lower() for ext in ALLOWED_IMAGE_EXTENSIONS)
+_ALLOWED_VIDEO_EXT = frozenset(ext.lower() for ext in ALLOWED_VIDEO_EXTENSIONS)
+_MAX_IMAGE_BYTES = MAX_ADDITIONAL_IMAGE_SIZE_MB * 1024 * 1024
+_MAX_VIDEO_BYTES = MAX_VIDEO_SIZE_MB * 1024 * 1024
+
 # --- NOVO FORMULÁRIO DE CADASTRO ---
 class CustomUserCreationForm(UserCreationForm):
     email = forms.EmailField(
@@ -75,30 +84,31 @@ class PetForm(forms.ModelForm):
             if field_name == "descricao":
                 field.widget.attrs["rows"] = 5
 
-        self._existing_extra_photos = self.instance.fotos_extras.count() if self.instance.pk else 0
+        # Uma única leitura das fotos (servida pelo prefetch da view, quando houver)
+        extras = list(self.instance.fotos_extras.all()) if self.instance.pk else []
+        self._existing_extra_photos = len(extras)
 
-        if self.instance.pk and self.instance.fotos_extras.exists():
+        if extras:
+            # Campos novos entram no fim do dicionário, logo após os demais.
             self.fields["fotos_extras_remover"] = forms.ModelMultipleChoiceField(
                 required=False,
-                queryset=self.instance.fotos_extras.order_by("ordem", "id"),
+                queryset=self.instance.fotos_extras.all(),
                 widget=forms.CheckboxSelectMultiple(attrs={"class": "form-check-input"}),
                 label="Remover fotos existentes",
             )
-            self.fields.move_to_end("fotos_extras_remover")
 
-    # MÉTODOS DE VALIDAÇÃO (sem alterações) ...
+    # MÉTODOS DE VALIDAÇÃO
     def _validate_file_extension(self, filename, allowed_extensions):
-        extension = filename.split(".")[-1].lower()
+        extension = os.path.splitext(filename)[1][1:].lower()
         if extension not in allowed_extensions:
             raise ValidationError(
-                f"Formato não permitido: .{extension}. Use: {', '.join(allowed_extensions)}."
+                f"Formato não permitido: .{extension}. Use: {', '.join(sorted(allowed_extensions))}."
             )
 
-    def _validate_file_size(self, file_obj, max_size_mb):
-        max_bytes = max_size_mb * 1024 * 1024
+    def _validate_file_size(self, file_obj, max_bytes):
         if file_obj.size > max_bytes:
             raise ValidationError(
-                f"O arquivo {file_obj.name} excede o limite de {max_size_mb}MB."
+                f"O arquivo {file_obj.name} excede o limite de {max_bytes // (1024 * 1024)}MB."
             )
 
     def clean_nome(self):
@@ -119,14 +129,14 @@ class PetForm(forms.ModelForm):
             if total > MAX_ADDITIONAL_PHOTOS:
                 raise ValidationError(f"Você pode ter no máximo {MAX_ADDITIONAL_PHOTOS} fotos extras.")
             for file_obj in extra_files:
-                self._validate_file_extension(file_obj.name, ALLOWED_IMAGE_EXTENSIONS)
-                self._validate_file_size(file_obj, MAX_ADDITIONAL_IMAGE_SIZE_MB)
+                self._validate_file_extension(file_obj.name, _ALLOWED_IMAGE_EXT)
+                self._validate_file_size(file_obj, _MAX_IMAGE_BYTES)
         cleaned_data["fotos_adicionais"] = extra_files
 
         video_file = cleaned_data.get("video")
         if video_file:
-            self._validate_file_extension(video_file.name, ALLOWED_VIDEO_EXTENSIONS)
-            self._validate_file_size(video_file, MAX_VIDEO_SIZE_MB)
+            self._validate_file_extension(video_file.name, _ALLOWED_VIDEO_EXT)
+            self._validate_file_size(video_file, _MAX_VIDEO_BYTES)
         
         especie = cleaned_data.get("especie")
         raca = cleaned_data.get("raca")
@@ -137,14 +147,13 @@ class PetForm(forms.ModelForm):
 
     def save(self, commit=True):
         pet = super().save(commit=False)
-        
-        # Atribui o solicitante, se for um novo pet
+
+        # Novo pet: atribui o solicitante e, se não for staff, força o status PENDENTE.
+        # Todos os campos ficam definidos antes do único INSERT.
         if not pet.pk and self.user:
             pet.solicitante = self.user
-
-        # Se o usuário não for staff, força o status para PENDENTE em novos cadastros
-        if not self.user.is_staff and not pet.pk:
-            pet.status = Pet.StatusChoices.PENDENTE
+            if not self.user.is_staff:
+                pet.status = Pet.StatusChoices.PENDENTE
 
         if commit:
             pet.save()
@@ -160,13 +169,13 @@ class PetForm(forms.ModelForm):
             to_remove.delete()
         
         if extra_files:
-            existing_count = pet_instance.fotos_extras.count()
-            for index, file_obj in enumerate(extra_files, start=existing_count + 1):
-                PetExtraPhoto.objects.create(
-                    pet=pet_instance,
-                    imagem=file_obj,
-                    ordem=index,
-                )
+            last_order = pet_instance.fotos_extras.aggregate(last=Max("ordem"))["last"] or 0
+            PetExtraPhoto.objects.bulk_create(
+                [
+                    PetExtraPhoto(pet=pet_instance, imagem=file_obj, ordem=index)
+                    for index, file_obj in enumerate(extra_files, start=last_order + 1)
+                ]
+            )
 
     class Meta:
         model = Pet
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-15 21:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adocoes', '0003_pet_solicitante_alter_pet_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pet',
+            name='solicitante',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pets_cadastrados', to=settings.AUTH_USER_MODEL, verbose_name='Solicitante'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['status', '-data_cadastro'], name='pet_status_cadastro_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['solicitante', '-data_cadastro'], name='pet_solicitante_cadastro_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['status', '-data_atualizacao'], name='pet_status_atualizacao_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['especie', 'status'], name='pet_especie_status_idx'),
+        ),
+    ]
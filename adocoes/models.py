@@ -45,6 +45,7 @@ class Pet(models.Model):
         blank=True,
         related_name="pets_cadastrados",
         verbose_name="Solicitante",
+        db_index=False, # Coberto pelo índice (solicitante, -data_cadastro) em Meta.indexes
     )
 
     nome = models.CharField(
@@ -123,10 +124,13 @@ class Pet(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             base_slug = slugify(self.nome)
+            # Busca de uma só vez os slugs que podem colidir e resolve o sufixo em Python
+            existing = set(
+                Pet.objects.filter(slug__startswith=base_slug).values_list("slug", flat=True)
+            )
             unique_slug = base_slug
             num = 1
-            # Garante que o slug seja único no banco de dados
-            while Pet.objects.filter(slug=unique_slug).exists():
+            while unique_slug in existing:
                 unique_slug = f"{base_slug}-{num}"
                 num += 1
             self.slug = unique_slug
@@ -147,6 +151,13 @@ class Pet(models.Model):
                 fields=["nome", "especie"], name="unique_pet_nome_especie"
             )
         ]
+        # Cobrem os filtros e ordenações da galeria e do relatório
+        indexes = [
+            models.Index(fields=["status", "-data_cadastro"], name="pet_status_cadastro_idx"),
+            models.Index(fields=["solicitante", "-data_cadastro"], name="pet_solicitante_cadastro_idx"),
+            models.Index(fields=["status", "-data_atualizacao"], name="pet_status_atualizacao_idx"),
+            models.Index(fields=["especie", "status"], name="pet_especie_status_idx"),
+        ]
 
     @property
     def limite_fotos_extras(self):
@@ -1,3 +1,76 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .forms import PetForm
+from .models import Pet, PetExtraPhoto
+
+
+class PetFormQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("dono", password="senha")
+        self.pet = Pet.objects.create(
+            nome="Rex", idade=2, descricao="Brincalhão.", solicitante=self.user
+        )
+        for ordem in range(1, 5):
+            PetExtraPhoto.objects.create(pet=self.pet, imagem=f"extra{ordem}.png", ordem=ordem)
+
+    def test_edit_form_with_prefetched_photos_renders_in_one_query(self):
+        pet = Pet.objects.prefetch_related("fotos_extras").get(pk=self.pet.pk)
+        with self.assertNumQueries(1):
+            form = PetForm(instance=pet, user=self.user)
+            form.as_p()
+        self.assertEqual(form._existing_extra_photos, 4)
+
+
+class PetPageCacheTests(TestCase):
+    def setUp(self):
+        self.client.get(reverse("entrar_visitante"))
+
+    def test_visitor_gallery_shows_new_pet_immediately(self):
+        self.client.get(reverse("galeria_pets"))
+        Pet.objects.create(
+            nome="Zed", idade=1, descricao="Novo.", status=Pet.StatusChoices.DISPONIVEL,
+            foto_principal="zed.png",
+        )
+        response = self.client.get(reverse("galeria_pets"))
+        self.assertContains(response, "Zed")
+
+    def test_visitor_detail_is_cached_only_by_the_browser(self):
+        pet = Pet.objects.create(
+            nome="Rex", idade=2, descricao="Calmo.", status=Pet.StatusChoices.DISPONIVEL,
+            foto_principal="rex.png",
+        )
+        response = self.client.get(pet.get_absolute_url())
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("max-age=60", response["Cache-Control"])
+
+
+class VisitorAccessTests(TestCase):
+    def setUp(self):
+        User.objects.create_user("dono", password="senha")
+
+    def test_logout_ends_visitor_access(self):
+        self.client.get(reverse("entrar_visitante"))
+        self.client.post(reverse("landing"), {"username": "dono", "password": "senha"})
+        self.client.post(reverse("logout"))
+        response = self.client.get(reverse("galeria_pets"))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith(reverse("landing")))
+
+
+class PetUpdateViewQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("dono", password="senha")
+        self.pet = Pet.objects.create(
+            nome="Rex", idade=2, descricao="Brincalhão.", solicitante=self.user
+        )
+        for ordem in range(1, 5):
+            PetExtraPhoto.objects.create(pet=self.pet, imagem=f"extra{ordem}.png", ordem=ordem)
+
+    def test_edit_page_loads_pet_and_photos_once(self):
+        self.client.force_login(self.user)
+        # pet + solicitante, prefetch das fotos e o usuário da sessão
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("editar_pet", kwargs={"slug": self.pet.slug}))
+        self.assertEqual(response.status_code, 200)
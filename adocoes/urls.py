@@ -1,6 +1,5 @@
 # adocoes/urls.py
 from django.urls import path
-from django.contrib.auth import views as auth_views
 from . import views
 
 urlpatterns = [
@@ -9,8 +8,8 @@ urlpatterns = [
     path('entrar-visitante/', views.VisitorRedirectView.as_view(), name='entrar_visitante'),
     path('cadastro/', views.SignUpView.as_view(), name='signup'),
     
-    # Usamos a view de Logout nativa do Django.
-    path('logout/', auth_views.LogoutView.as_view(), name='logout'),
+    # Logout nativo do Django, que também apaga o cookie de visitante.
+    path('logout/', views.LogoutView.as_view(), name='logout'),
 
     # --- ROTAS DO APLICATIVO (PROTEGIDAS) ---
     path('galeria/', views.PetListView.as_view(), name='galeria_pets'),
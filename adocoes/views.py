@@ -7,18 +7,30 @@ from django.contrib.messages.views import SuccessMessageMixin
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView, RedirectView
 from django.shortcuts import redirect
 from django.contrib import messages
+from django.db.models import Count, Q
+from django.utils.cache import patch_cache_control
 from .models import Pet
 from .forms import PetForm, CustomUserCreationForm
 
+# Cookie assinado que marca o navegador como 'visitante' (sem tocar na sessão)
+VISITOR_COOKIE_NAME = 'vz'
+
+# Opções estáticas do filtro de espécie, montadas uma única vez
+_ESPECIES_CHOICES = list(Pet.EspecieChoices.choices)
+
+# Rótulos e valores válidos de status, para o relatório
+_STATUS_LABELS = dict(Pet.StatusChoices.choices)
+_VALID_STATUSES = frozenset(_STATUS_LABELS)
+
 # --- MIXINS DE PERMISSÃO ATUALIZADOS ---
 
 class VisitorOrUserRequiredMixin(AccessMixin):
     """
     Mixin customizado que verifica se o usuário está autenticado OU
-    se identificou como 'visitante' na sessão.
+    se identificou como 'visitante' pelo cookie assinado.
     """
     def dispatch(self, request, *args, **kwargs):
-        is_visitor = request.session.get('is_visitor', False)
+        is_visitor = request.get_signed_cookie(VISITOR_COOKIE_NAME, default=False)
         if not request.user.is_authenticated and not is_visitor:
             # Redireciona para a landing page se não for nem usuário nem visitante
             messages.info(request, "Por favor, faça login ou entre como visitante para continuar.")
@@ -28,6 +40,20 @@ class VisitorOrUserRequiredMixin(AccessMixin):
     def get_login_url(self):
         return reverse_lazy('landing')
 
+class ContextDefaultsMixin:
+    """
+    Preenche o contexto comum a todas as páginas: a marca de visitante
+    (usada pela navbar) e o título fixo da view, quando houver.
+    """
+    page_title = None
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['is_visitor'] = self.request.get_signed_cookie(VISITOR_COOKIE_NAME, default=False)
+        if self.page_title:
+            context['page_title'] = self.page_title
+        return context
+
 class StaffRequiredMixin(UserPassesTestMixin):
     """ Exige que o usuário seja da equipe (staff). """
     def test_func(self):
@@ -38,6 +64,14 @@ class StaffRequiredMixin(UserPassesTestMixin):
 
 class PetOwnerOrStaffRequiredMixin(UserPassesTestMixin):
     """ Exige que o usuário seja o dono do pet ou da equipe. """
+    def get_object(self, queryset=None):
+        # test_func e a view pedem o mesmo pet: busca (com o prefetch) uma única vez
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_pet'):
+            self._pet = super().get_object()
+        return self._pet
+
     def test_func(self):
         pet = self.get_object()
         user = self.request.user
@@ -45,47 +79,49 @@ class PetOwnerOrStaffRequiredMixin(UserPassesTestMixin):
 
 # --- VIEWS DE ENTRADA E AUTENTICAÇÃO ---
 
-class LandingPageView(auth_views.LoginView):
+class LandingPageView(ContextDefaultsMixin, auth_views.LoginView):
     """
     Esta é a nova porta de entrada. Ela herda da LoginView do Django
     para processar o formulário de login, mas usa nosso template customizado.
     """
     template_name = 'adocoes/landing.html'
     redirect_authenticated_user = True # Se o usuário já estiver logado, redireciona
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['page_title'] = "Bem-vindo ao FeedPet"
-        return context
+    page_title = "Bem-vindo ao FeedPet"
 
 class VisitorRedirectView(RedirectView):
     """
-    View simples para marcar a sessão do usuário como 'visitante'
+    View simples para marcar o navegador como 'visitante'
     e redirecioná-lo para a galeria.
     """
     pattern_name = 'galeria_pets'
 
     def get(self, request, *args, **kwargs):
-        request.session['is_visitor'] = True
-        # Limpa a sessão de visitante ao fazer logout
-        request.session.set_expiry(0) 
-        return super().get(request, *args, **kwargs)
+        response = super().get(request, *args, **kwargs)
+        # Cookie de sessão do navegador: expira ao fechá-lo (o logout também o remove)
+        response.set_signed_cookie(VISITOR_COOKIE_NAME, '1', max_age=None, httponly=True)
+        return response
+
+class LogoutView(auth_views.LogoutView):
+    """
+    Logout nativo do Django que também remove a marca de visitante,
+    encerrando o acesso como fazia o flush da sessão.
+    """
+    def post(self, request, *args, **kwargs):
+        response = super().post(request, *args, **kwargs)
+        response.delete_cookie(VISITOR_COOKIE_NAME)
+        return response
 
-class SignUpView(SuccessMessageMixin, CreateView):
+class SignUpView(ContextDefaultsMixin, SuccessMessageMixin, CreateView):
     """ View de cadastro de usuário. """
     form_class = CustomUserCreationForm
     template_name = 'registration/signup.html'
     success_url = reverse_lazy('landing') # Após cadastro, volta para a landing para fazer login
     success_message = "✅ Conta criada com sucesso! Faça o login para começar."
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['page_title'] = "Crie sua Conta"
-        return context
+    page_title = "Crie sua Conta"
 
 # --- VIEWS DO APLICATIVO (PROTEGIDAS) ---
 
-class PetListView(VisitorOrUserRequiredMixin, ListView):
+class PetListView(VisitorOrUserRequiredMixin, ContextDefaultsMixin, ListView):
     model = Pet
     template_name = 'adocoes/pet_list.html'
     context_object_name = 'pets'
@@ -117,7 +153,10 @@ class PetListView(VisitorOrUserRequiredMixin, ListView):
         if especie:
             queryset = queryset.filter(especie=especie)
         
-        return queryset.order_by('-data_cadastro')
+        # Carrega apenas as colunas exibidas nos cards da galeria
+        return queryset.only(
+            'nome', 'slug', 'especie', 'idade', 'descricao', 'foto_principal'
+        ).order_by('-data_cadastro')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -125,9 +164,7 @@ class PetListView(VisitorOrUserRequiredMixin, ListView):
 
         # Passa o modo de filtro para o template, para que ele possa mudar o título
         context['filter_mode'] = filter_type if filter_type == 'meus' else 'public'
-        
-        context['is_visitor'] = self.request.session.get('is_visitor', False)
-        context['especies'] = Pet.EspecieChoices.choices
+        context['especies'] = _ESPECIES_CHOICES
         
         # O título da página agora é dinâmico
         if context['filter_mode'] == 'meus':
@@ -137,23 +174,35 @@ class PetListView(VisitorOrUserRequiredMixin, ListView):
         
         return context
 
-class PetDetailView(VisitorOrUserRequiredMixin, DetailView):
+class PetDetailView(VisitorOrUserRequiredMixin, ContextDefaultsMixin, DetailView):
     model = Pet
     template_name = 'adocoes/pet_detail.html'
     slug_field = 'slug'
     slug_url_kwarg = 'slug'
 
+    def get_queryset(self):
+        # A galeria do template percorre pet.fotos_extras e exibe o solicitante.
+        return Pet.objects.select_related('solicitante').prefetch_related('fotos_extras')
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        # Visitantes não veem contato nem ações: cache só no navegador e por
+        # pouco tempo, para que mudanças de status (ex.: ADOTADO) apareçam logo
+        if not request.user.is_authenticated:
+            patch_cache_control(response, private=True, max_age=60)
+        return response
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['is_visitor'] = self.request.session.get('is_visitor', False)
         context['page_title'] = self.object.nome
         return context
 
-class PetCreateView(LoginRequiredMixin, SuccessMessageMixin, CreateView):
+class PetCreateView(LoginRequiredMixin, ContextDefaultsMixin, SuccessMessageMixin, CreateView):
     model = Pet
     form_class = PetForm
     template_name = 'adocoes/pet_form.html'
     success_url = reverse_lazy('galeria_pets')
+    page_title = 'Cadastrar Novo Pet'
     
     def get_success_message(self, cleaned_data):
         return "🐾 Seu pet foi cadastrado e enviado para análise. Obrigado!" if not self.request.user.is_staff else "🐾 O pet foi cadastrado com sucesso!"
@@ -167,12 +216,7 @@ class PetCreateView(LoginRequiredMixin, SuccessMessageMixin, CreateView):
         self.object = form.save()
         return super().form_valid(form)
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['page_title'] = 'Cadastrar Novo Pet'
-        return context
-
-class PetUpdateView(PetOwnerOrStaffRequiredMixin, SuccessMessageMixin, UpdateView):
+class PetUpdateView(PetOwnerOrStaffRequiredMixin, ContextDefaultsMixin, SuccessMessageMixin, UpdateView):
     model = Pet
     form_class = PetForm
     template_name = 'adocoes/pet_form.html'
@@ -180,6 +224,9 @@ class PetUpdateView(PetOwnerOrStaffRequiredMixin, SuccessMessageMixin, UpdateVie
     slug_url_kwarg = 'slug'
     success_message = "✅ O cadastro do pet foi atualizado com sucesso!"
 
+    def get_queryset(self):
+        return Pet.objects.select_related('solicitante').prefetch_related('fotos_extras')
+
     def get_success_url(self):
         return self.object.get_absolute_url()
     
@@ -193,7 +240,7 @@ class PetUpdateView(PetOwnerOrStaffRequiredMixin, SuccessMessageMixin, UpdateVie
         context['page_title'] = f'Editando: {self.object.nome}'
         return context
 
-class PetDeleteView(PetOwnerOrStaffRequiredMixin, SuccessMessageMixin, DeleteView):
+class PetDeleteView(PetOwnerOrStaffRequiredMixin, ContextDefaultsMixin, SuccessMessageMixin, DeleteView):
     model = Pet
     template_name = 'adocoes/pet_confirm_delete.html'
     slug_field = 'slug'
@@ -201,27 +248,34 @@ class PetDeleteView(PetOwnerOrStaffRequiredMixin, SuccessMessageMixin, DeleteVie
     success_url = reverse_lazy('galeria_pets')
     success_message = "🗑️ Pet removido com sucesso."
 
-class RelatorioPetView(StaffRequiredMixin, ListView):
+class RelatorioPetView(StaffRequiredMixin, ContextDefaultsMixin, ListView):
     model = Pet
     template_name = 'adocoes/relatorio_pets.html'
     context_object_name = 'pets'
 
-    def get_queryset(self):
+    def get_current_status(self):
         status_filter = self.request.GET.get('status', Pet.StatusChoices.PENDENTE).upper()
-        valid_statuses = [choice[0] for choice in Pet.StatusChoices.choices]
-        if status_filter not in valid_statuses:
+        if status_filter not in _VALID_STATUSES:
             status_filter = Pet.StatusChoices.PENDENTE
-        return Pet.objects.filter(status=status_filter).order_by('-data_atualizacao')
+        return status_filter
+
+    def get_queryset(self):
+        return (
+            Pet.objects.filter(status=self.get_current_status())
+            .select_related('solicitante')
+            .order_by('-data_atualizacao')
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        current_status = self.request.GET.get('status', Pet.StatusChoices.PENDENTE).upper()
+        current_status = self.get_current_status()
         context['status_choices'] = Pet.StatusChoices.choices
         context['current_status'] = current_status
-        context['page_title'] = f"Relatório: Pets {Pet.StatusChoices(current_status).label}"
-        context['counts'] = {
-            s[0].lower(): Pet.objects.filter(status=s[0]).count() for s in Pet.StatusChoices.choices
-        }
+        context['page_title'] = f"Relatório: Pets {_STATUS_LABELS[current_status]}"
+        # Um único agregado condicional preenche todos os contadores de status
+        context['counts'] = Pet.objects.aggregate(**{
+            value.lower(): Count('id', filter=Q(status=value)) for value in _STATUS_LABELS
+        })
         return context
     
 
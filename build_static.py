@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Let the views know we are producing a static preview (turns off pagination).
@@ -19,13 +22,23 @@ from django.urls import reverse
 from adocoes.models import Pet
 
 OUTPUT_DIR = Path("netlify_dist")
+MAX_WORKERS = 8
+CHUNK_SIZE = 100
+
+_local = threading.local()
 
 
 def copy_media() -> None:
     media_root = Path(settings.MEDIA_ROOT)
     dest = OUTPUT_DIR / "media"
     if media_root.exists():
-        shutil.copytree(media_root, dest, dirs_exist_ok=True)
+        try:
+            # Hardlinks avoid copying the photo/video bytes when on the same filesystem.
+            shutil.copytree(media_root, dest, dirs_exist_ok=True, copy_function=os.link)
+        except OSError:
+            # Cross-device or unsupported: drop any partial links and copy instead.
+            shutil.rmtree(dest, ignore_errors=True)
+            shutil.copytree(media_root, dest, dirs_exist_ok=True)
 
 
 def save_response(response, destination: Path, url: str) -> None:
@@ -36,25 +49,40 @@ def save_response(response, destination: Path, url: str) -> None:
     destination.write_bytes(response.content)
 
 
+def visitor_client() -> Client:
+    client = Client()
+    # Enter as a visitor; the client keeps the signed cookie for later requests.
+    client.get(reverse("entrar_visitante"))
+    return client
+
+
+def render_pet(pet: Pet) -> None:
+    # One client per worker thread so the cookie jars are never shared.
+    client = getattr(_local, "client", None)
+    if client is None:
+        client = _local.client = visitor_client()
+    url = pet.get_absolute_url()
+    save_response(client.get(url), OUTPUT_DIR / "pet" / pet.slug / "index.html", url)
+
+
 def main() -> None:
     if OUTPUT_DIR.exists():
         shutil.rmtree(OUTPUT_DIR)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    client = Client()
-    session = client.session
-    session["is_visitor"] = True
-    session.save()
-    client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+    client = visitor_client()
 
     save_response(client.get(reverse("landing")), OUTPUT_DIR / "index.html", "/")
     save_response(
         client.get(reverse("galeria_pets")), OUTPUT_DIR / "galeria" / "index.html", "/galeria/"
     )
 
-    for pet in Pet.objects.all():
-        dest = OUTPUT_DIR / "pet" / pet.slug / "index.html"
-        save_response(client.get(pet.get_absolute_url()), dest, pet.get_absolute_url())
+    # Only the slug is needed here; each page is rendered by the view's own queryset.
+    # Stream the pets and render them one chunk at a time to keep memory bounded.
+    pets = Pet.objects.only("slug").order_by("pk").iterator(chunk_size=CHUNK_SIZE)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        while chunk := list(islice(pets, CHUNK_SIZE)):
+            list(executor.map(render_pet, chunk))
 
     copy_media()
     print(f"Static site generated at: {OUTPUT_DIR.resolve()}")
@@ -86,4 +86,10 @@ MESSAGE_TAGS = {
     messages.SUCCESS: "success",
     messages.WARNING: "warning",
     messages.ERROR: "danger",
-}
\ No newline at end of file
+}
+
+# --- SESSÕES ---
+# Sessão guardada em cookie assinado: nenhuma leitura/escrita em django_session por requisição
+SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
+SESSION_COOKIE_HTTPONLY = True
+SESSION_COOKIE_SECURE = not DEBUG